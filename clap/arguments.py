@@ -91,9 +91,11 @@ class Argument:
 
         self.default = default
 
-        if isinstance(n_args, tuple):
+        if isinstance(n_args, Range):
+            pass
+        elif isinstance(n_args, tuple):
             n_args = Range(*n_args)
-        elif not isinstance(n_args, Range):
+        else:
             raise TypeError("n_args must be a tuple or Range")
 
         self.n_args = n_args
@@ -58,10 +58,20 @@ class SupportsCommands(Protocol):
     ----------
     all_commands : :class:`dict`
         A mapping of command names to :class:`Command` instances.
+
+    Methods
+    -------
+    _invalidate()
+        Discard everything the object has built from :attr:`all_commands`.
+        :func:`add_command` and :func:`remove_command` call this whenever they
+        change the commands.
     """
 
     all_commands: Dict[str, Union[Command[Any], Group]]
 
+    def _invalidate(self) -> None:
+        ...
+
 
 class Command(Generic[T]):
     """Represents a command-line argument that triggers a callback function.
@@ -113,6 +123,8 @@ class Command(Generic[T]):
 
         self.aliases = aliases or []
         self.all_options = all_options or {}
+        self._option_lookup: Optional[Dict[str, Option[Any]]] = None
+        self._constrained_options: Optional[List[Option[Any]]] = None
         self.arguments = arguments or []
 
         if parent is not None and not isinstance(parent, SupportsCommands):
@@ -128,6 +140,10 @@ class Command(Generic[T]):
     def __call__(self, *args: Any, **kwargs: Any) -> T:
         return self.invoke(*args, **kwargs)
 
+    def _invalidate(self) -> None:
+        self._option_lookup = None
+        self._constrained_options = None
+
     @property
     def options(self) -> Set[Option[Any]]:
         """A set of all options that are attached to this command."""
@@ -155,11 +171,12 @@ class Command(Generic[T]):
 
         usage = self.name
 
-        assert self.options, "Command must have at least the default help."
-        options = " | ".join(
-            f"--{option.name}" for option in set(self.all_options.values())
-        )
-        usage += f" [{options}]"
+        # Exclude aliases while retaining the original order.
+        options = [v for k, v in self.all_options.items() if k == v.name]
+
+        assert options, "Command must have at least the default help."
+        flags = " | ".join(f"--{option.name}" for option in options)
+        usage += f" [{flags}]"
 
         for argument in self.arguments:
             fmt = " <%s>" if argument.default is MISSING else " [%s]"
@@ -172,8 +189,6 @@ class Command(Generic[T]):
 
         node = h.add_section("OPTIONS", skip_if_empty=True)
 
-        # Retain the order of the options for the help message.
-        options = [v for k, v in self.all_options.items() if k == v.name]
         for option in options:
             node.add_item(**option.help_info)
 
@@ -257,6 +272,8 @@ def add_command(
     if isinstance(parent, SupportsCommands):
         command.parent = parent
 
+    parent._invalidate()
+
     if command.name not in parent.all_commands:
         parent.all_commands[command.name] = command
     else:
@@ -303,6 +320,8 @@ def remove_command(
     if command is None:
         return None
 
+    parent._invalidate()
+
     if name in command.aliases:
         try:
             command.aliases.remove(name)
@@ -322,11 +341,12 @@ COMMAND_DESCRIPTION_REGEX = re.compile(
     r"^(?:.*?\n\n)?(.*?)(?:Parameters\n---+.*?)?(?:\n\n|\Z)", re.DOTALL
 )
 SECTION_REGEX_FMT = r"{section_name}\n-+\n\s*(.*?)(?:\n\n|\Z)"
+# Matches both the ``Parameters`` and ``Other Parameters`` sections, so the
+# docstring is scanned once for all of them. The first group is the name of
+# the section and the second is its body.
 PARAMETER_SECTION_REGEX = re.compile(
-    SECTION_REGEX_FMT.format(section_name="Parameters"), re.DOTALL
-)
-OTHER_PARAMETER_SECTION_REGEX = re.compile(
-    SECTION_REGEX_FMT.format(section_name="Other Parameters"), re.DOTALL
+    SECTION_REGEX_FMT.format(section_name="((?:Other )?Parameters)"),
+    re.DOTALL,
 )
 PARAMETER_DESCRIPTION_REGEX = re.compile(
     r"(?P<name>\S+)\s*:.*?\n(?P<description>.*?)(?=\S+\s*:|\Z)", re.DOTALL
@@ -404,25 +424,39 @@ def _extract_parameter_descriptions(
     docstring: str,
     /,
     *,
-    patterns: Dict[re.Pattern[str], re.Pattern[str]] = {
-        PARAMETER_SECTION_REGEX: PARAMETER_DESCRIPTION_REGEX,
-        OTHER_PARAMETER_SECTION_REGEX: PARAMETER_DESCRIPTION_REGEX,
-    },
+    section_pattern: re.Pattern[str] = PARAMETER_SECTION_REGEX,
+    description_pattern: re.Pattern[str] = PARAMETER_DESCRIPTION_REGEX,
 ) -> Dict[str, str]:
     data: Dict[str, str] = {}
+    seen: Set[str] = set()
 
-    for section_pattern, description_pattern in patterns.items():
-        match = section_pattern.search(docstring)
+    for match in section_pattern.finditer(docstring):
+        section, body = match.groups()
 
-        if match is None:
+        # Only the first section of each kind describes the parameters; a
+        # later heading with the same name belongs to some other section's
+        # text, such as an example in the notes.
+        if section in seen:
             continue
 
-        for name, description in description_pattern.findall(match.group(1)):
+        seen.add(section)
+
+        for name, description in description_pattern.findall(body):
             data[name] = fold_text(description)
 
     return data
 
 
+# Maps each kind of function parameter to the class that represents it.
+_PARAMETER_KIND_MAPPING: Dict[Any, Type[Union[Argument, Option[Any]]]] = {
+    inspect.Parameter.POSITIONAL_ONLY: Argument,
+    inspect.Parameter.VAR_POSITIONAL: Argument,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD: Option,
+    inspect.Parameter.KEYWORD_ONLY: Option,
+    inspect.Parameter.VAR_KEYWORD: Option,
+}
+
+
 def convert_parameter(
     parameter: inspect.Parameter,
     /,
@@ -471,16 +505,8 @@ def convert_parameter(
             f"Missing type annotation for parameter {name!r}."
         ) from exc
 
-    kind_mapping = {
-        inspect.Parameter.POSITIONAL_ONLY: Argument,
-        inspect.Parameter.VAR_POSITIONAL: Argument,
-        inspect.Parameter.POSITIONAL_OR_KEYWORD: Option,
-        inspect.Parameter.KEYWORD_ONLY: Option,
-        inspect.Parameter.VAR_KEYWORD: Option,
-    }
-
     try:
-        argument_type = kind_mapping[parameter.kind]
+        argument_type = _PARAMETER_KIND_MAPPING[parameter.kind]
     except KeyError as exc:
         raise ValueError(
             f"Unsupported parameter kind {parameter.kind!r}."
@@ -504,7 +530,7 @@ class _CommandBase(SupportsArguments, SupportsOptions):
         The function to call when the command is invoked.
     arguments : :class:`list`
         A list of :class:`Argument` instances.
-    options : :class:`dict`
+    all_options : :class:`dict`
         A mapping of option names to :class:`Option` instances.
     """
 
@@ -29,7 +29,7 @@ if TYPE_CHECKING:
     from builtins import set as Set
     from typing import Any, Callable, Optional, Union
 
-    from .option import Option
+    from .options import Option
 
 __all__ = [
     "Group",
@@ -102,6 +102,8 @@ class Group:
         self.description = description or parsed_doc.get("__description__", "")
         self.aliases = aliases or []
         self.all_options = all_options or {}
+        self._option_lookup: Optional[Dict[str, Option[Any]]] = None
+        self._constrained_options: Optional[List[Option[Any]]] = None
         add_option(self, DefaultHelp)
 
         if parent is not MISSING and not isinstance(parent, SupportsCommands):
@@ -110,7 +112,7 @@ class Group:
         self.parent = parent or None
         self.invoke_without_command = invoke_without_command
 
-        self.all_commands: Dict[str, Union[Command[Any], SupportsCommands]]
+        self.all_commands: Dict[str, Union[Command[Any], Group]]
         self.all_commands = {}
         accumulate_commands(self)
         convert_command_parameters(self, parsed_doc)
@@ -133,6 +135,10 @@ class Group:
     def __call__(self, *args: Any, **kwargs: Any) -> None:
         self.invoke(*args, **kwargs)
 
+    def _invalidate(self) -> None:
+        self._option_lookup = None
+        self._constrained_options = None
+
     def display_help(self, *, fmt: HelpFormatter) -> None:
         """Display this help message and exit."""
         h = Help()
@@ -145,21 +151,20 @@ class Group:
 
         usage = self.name
 
-        assert self.options, "Group must have at least the default help."
-        options = " | ".join(
-            f"--{option.name}" for option in self.all_options.values()
-        )
-        usage += f" [{options}]"
+        # Exclude aliases while retaining the original order.
+        options = [v for k, v in self.all_options.items() if k == v.name]
 
-        h.add_section("USAGE", usage)
+        assert options, "Group must have at least the default help."
+        flags = " | ".join(f"--{option.name}" for option in options)
+        usage += f" [{flags}]"
+
+        h.add_section("USAGE", brief=usage)
 
         node = h.add_section("ALIASES", skip_if_empty=True)
         node.add_item(brief=", ".join(self.aliases))
 
         node = h.add_section("OPTIONS", skip_if_empty=True)
 
-        # Retain the order of the options for the help message.
-        options = [v for k, v in self.all_options.items() if k == v.name]
         for option in options:
             node.add_item(**option.help_info)
 
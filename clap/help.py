@@ -10,7 +10,7 @@ from __future__ import annotations
 
 import copy
 import dataclasses
-import os
+import shutil
 import textwrap
 from typing import TYPE_CHECKING, Mapping, NamedTuple, NewType, Protocol
 
@@ -44,6 +44,12 @@ class HelpInfo(Mapping):
     brief: str
 
 
+def _get_default_width() -> int:
+    # `shutil` falls back to 80 columns when the output is not a terminal,
+    # where `os.get_terminal_size` raises instead.
+    return min(shutil.get_terminal_size().columns, 80)
+
+
 @dataclasses.dataclass()
 class HelpFormatter:
     """Represents the configuration for the help message.
@@ -65,7 +71,7 @@ class HelpFormatter:
         Whether to omit newlines between sections.
     """
 
-    width: int = min(os.get_terminal_size().columns, 80)
+    width: int = dataclasses.field(default_factory=_get_default_width)
     name_width: int = -1
     indent: int = 2
     placeholder: str = "[...]"
@@ -250,11 +256,13 @@ class HelpTree:
 class Help:
     def __init__(
         self,
-        fmt: HelpFormatter = HelpFormatter(),
-        tree: HelpTree = HelpTree(),
+        fmt: Optional[HelpFormatter] = None,
+        tree: Optional[HelpTree] = None,
     ) -> None:
-        self.fmt = fmt
-        self.tree = copy.deepcopy(tree)
+        self.fmt = HelpFormatter() if fmt is None else fmt
+        # Only a caller's tree needs copying, so that building this message
+        # leaves it untouched; a fresh tree is not shared with anything.
+        self.tree = HelpTree() if tree is None else copy.deepcopy(tree)
 
     @property
     def default_indent(self) -> str:
@@ -348,7 +356,7 @@ class Help:
             placeholder=placeholder,
             skip_if_empty=skip_if_empty,
         )
-        self.tree.data[name] = copy.deepcopy(node)
+        self.tree.data[name] = node
 
         # `add_line` is not used here because it would add a newline to the
         # marker, which, after expansion, already has a newline.
@@ -357,7 +365,7 @@ class Help:
         if not self.fmt.compact:
             self.tree.message += "\n"
 
-        return self.tree.data[name]
+        return node
 
     def add_line(
         self,
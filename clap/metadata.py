@@ -93,12 +93,12 @@ class Range(NamedTuple):
 
 
 if sys.version_info >= (3, 9):
-    _Set = set[str]
+    _FrozenSet = frozenset[str]
 else:
-    _Set = set
+    _FrozenSet = frozenset
 
 
-class Requires(_Set):
+class Requires(_FrozenSet):
     """A set of options that are required by an :class:`.Option`.
 
     This type is not meant to be used directly. Instead, pass it as an
@@ -106,11 +106,11 @@ class Requires(_Set):
     parameters.
     """
 
-    def __init__(self, *options: str) -> None:
-        super().__init__(options)
+    def __new__(cls, *options: str) -> Requires:
+        return super().__new__(cls, options)
 
 
-class Conflicts(_Set):
+class Conflicts(_FrozenSet):
     """A set of options names that are mutually exclusive with an
     :class:`.Option`.
 
@@ -119,8 +119,19 @@ class Conflicts(_Set):
     parameters.
     """
 
-    def __init__(self, *options: str) -> None:
-        super().__init__(options)
+    def __new__(cls, *options: str) -> Conflicts:
+        return super().__new__(cls, options)
+
+
+# Maps each supported metadata type to the keyword argument it provides.
+_METADATA_KEYS: Dict[type, str] = {
+    # Both `Argument` and `Option` accepts these.
+    Range: "n_args",
+    # Only `Option` accepts these.
+    Short: "alias",
+    Requires: "requires",
+    Conflicts: "conflicts",
+}
 
 
 def extract_metadata(metadata: Tuple[Any, ...], /) -> Dict[str, Any]:
@@ -140,25 +151,19 @@ def extract_metadata(metadata: Tuple[Any, ...], /) -> Dict[str, Any]:
         :class:`Argument` or :class:`Option`.
     """
     data: Dict[str, Any] = {}
-
-    mapping = {
-        # Both `Argument` and `Option` accepts these.
-        Range: "n_args",
-        # Only `Option` accepts these.
-        Short: "alias",
-        Requires: "requires",
-        Conflicts: "conflicts",
-    }
+    get_key = _METADATA_KEYS.get
 
     for value in metadata:
-        if isinstance(value, Range):
-            data["n_args"] = (value.minimum, value.maximum)
-            continue
-
-        try:
-            key = mapping[type(value)]
-        except KeyError:
-            continue  # Ignore any unknown metadata.
+        key = get_key(type(value))
+
+        if key is None:
+            # Subclasses miss the exact-type lookup, so check them one by one.
+            for metadata_type, metadata_key in _METADATA_KEYS.items():
+                if isinstance(value, metadata_type):
+                    key = metadata_key
+                    break
+            else:
+                continue  # Ignore any unknown metadata.
 
         data[key] = value
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import inspect
 import logging
 from typing import TYPE_CHECKING, Generic, Protocol, TypeVar
@@ -11,6 +12,7 @@ from .utils import MISSING
 
 if TYPE_CHECKING:
     from builtins import dict as Dict
+    from builtins import list as List
     from builtins import tuple as Tuple
     from builtins import type as Type
     from typing import Any, Iterable, Optional, Union
@@ -27,17 +29,35 @@ T = TypeVar("T")
 
 _log = logging.getLogger(__name__)
 
+# Most options have no requirements or conflicts, so they all share these
+# instead of allocating empty sets of their own.
+_EMPTY_REQUIRES = Requires()
+_EMPTY_CONFLICTS = Conflicts()
+
 
 class SupportsOptions(Protocol):
     """A protocol for objects that can have options attached to them.
 
     Attributes
     ----------
-    options : :class:`list`
-        A mapping of option names to :class:`Option` instances.
+    all_options : :class:`dict`
+        A mapping of option names and aliases to :class:`Option` instances.
+
+    Methods
+    -------
+    _invalidate()
+        Discard everything the object has built from :attr:`all_options`.
+        :func:`add_option` and :func:`remove_option` call this whenever they
+        change the options.
     """
 
-    options: Dict[str, Option[Any]]
+    all_options: Dict[str, Option[Any]]
+    # Built on first use by `get_option_lookup` and `get_constrained_options`.
+    _option_lookup: Optional[Dict[str, Option[Any]]]
+    _constrained_options: Optional[List[Option[Any]]]
+
+    def _invalidate(self) -> None:
+        ...
 
 
 class Option(Generic[T]):
@@ -56,9 +76,10 @@ class Option(Generic[T]):
     n_args : :class:`tuple`
         A tuple containing the minimum and maximum number of arguments that
         can be passed to the option.
-    alias : :class:`str`
+    alias : Optional[:class:`str`]
         A single-character alternative that can be used to identify the option.
-        (e.g. ``-h`` for ``--help`` or ``-V`` for ``--version``)
+        (e.g. ``-h`` for ``--help`` or ``-V`` for ``--version``) This is
+        ``None`` if the option does not have an alias.
     requires : :class:`Requires`
         A set of options that are required by this option.
     conflicts : :class:`Conflicts`
@@ -73,7 +94,7 @@ class Option(Generic[T]):
         target_type: Type[T] = MISSING,
         default: T = MISSING,
         n_args: Union[Range, Tuple[int, Optional[int]], int] = Range(0, 1),
-        alias: Short = MISSING,
+        alias: Optional[Short] = None,
         requires: Requires = MISSING,
         conflicts: Conflicts = MISSING,
         **kwargs: Any,
@@ -88,8 +109,9 @@ class Option(Generic[T]):
 
         if default is not MISSING and not isinstance(default, target_type):
             _log.warning(
-                f"Default value {default!r} is not an instance of "
-                + f"{target_type!r}."
+                "Default value %r is not an instance of %r.",
+                default,
+                target_type,
             )
 
         if default is MISSING and self.target_type is bool:
@@ -97,22 +119,24 @@ class Option(Generic[T]):
 
         self.default = default
 
-        if isinstance(n_args, int):
+        if isinstance(n_args, Range):
+            pass
+        elif isinstance(n_args, int):
             n_args = Range(n_args, n_args)
         elif isinstance(n_args, tuple):
             n_args = Range(*n_args)
-        elif not isinstance(n_args, Range):
-            raise TypeError("n_args must be a tuple or Range")
+        else:
+            raise TypeError("n_args must be an int, tuple or Range")
 
         self.n_args = n_args
 
         if alias and len(alias) > 1:
             raise ValueError("alias must be a single character")
 
-        self.alias = alias
+        self.alias = alias or None
 
-        self.requires = requires or Requires()
-        self.conflicts = conflicts or Conflicts()
+        self.requires = requires or _EMPTY_REQUIRES
+        self.conflicts = conflicts or _EMPTY_CONFLICTS
 
     @classmethod
     def from_parameter(
@@ -163,12 +187,12 @@ class Option(Generic[T]):
 
         return cls(**data)
 
-    @property
+    @functools.cached_property
     def as_snake_case(self) -> str:
         """Return the option as a snake_case string."""
         return self.name.replace("-", "_")
 
-    @property
+    @functools.cached_property
     def as_kebab_case(self) -> str:
         """Return the option as a kebab-case string."""
         return self.name.replace("_", "-")
@@ -189,7 +213,7 @@ class Option(Generic[T]):
         """
         name = ""
 
-        if self.alias is not MISSING:
+        if self.alias is not None:
             name += f"-{self.alias}, "
 
         name += f"--{self.name}"
@@ -236,11 +260,13 @@ class Option(Generic[T]):
         :class:`ValueError`
             If any of the given options conflict with this option.
         """
-        for option in options:
-            if option in self.conflicts:
-                raise ValueError(
-                    f"Option {self.name!r} conflicts with option {option!r}."
-                )
+        conflicting = self.conflicts.intersection(options)
+
+        if conflicting:
+            option = min(conflicting)
+            raise ValueError(
+                f"Option {self.name!r} conflicts with option {option!r}."
+            )
 
     def validate_requires(self, options: Iterable[str], /) -> None:
         """Validate that the given options are required by this option.
@@ -255,11 +281,102 @@ class Option(Generic[T]):
         :class:`ValueError`
             If any of the given options are not required by this option.
         """
-        for option in self.requires:
-            if option not in options:
-                raise ValueError(
-                    f"Option {self.name!r} requires option {option!r}."
-                )
+        missing = self.requires.difference(options)
+
+        if missing:
+            option = min(missing)
+            raise ValueError(
+                f"Option {self.name!r} requires option {option!r}."
+            )
+
+
+def get_option_lookup(obj: SupportsOptions, /) -> Dict[str, Option[Any]]:
+    """Get a mapping of every way an option can be spelled to the option.
+
+    On top of the names and aliases in :attr:`SupportsOptions.all_options`,
+    this includes the snake_case and kebab-case forms of each option's name,
+    so the parser can resolve a flag with a single lookup. The mapping is
+    cached on the object until :func:`add_option` or :func:`remove_option`
+    changes its options.
+
+    Parameters
+    ----------
+    obj : :class:`SupportsOptions`
+        The object whose options to look up.
+
+    Returns
+    -------
+    :class:`dict`
+        A mapping of option names, aliases and their case variants to
+        options.
+    """
+    lookup = obj._option_lookup
+
+    if lookup is None:
+        lookup = dict(obj.all_options)
+
+        # Exact names and aliases take precedence over case variants.
+        for option in obj.all_options.values():
+            lookup.setdefault(option.as_snake_case, option)
+            lookup.setdefault(option.as_kebab_case, option)
+
+        obj._option_lookup = lookup
+
+    return lookup
+
+
+def get_option_defaults(obj: SupportsOptions, /) -> Dict[str, Any]:
+    """Get the default keyword arguments for the object's options.
+
+    Options without a default are left out. The mapping is built on each
+    call, since a default can be changed in place.
+
+    Parameters
+    ----------
+    obj : :class:`SupportsOptions`
+        The object whose options to collect.
+
+    Returns
+    -------
+    :class:`dict`
+        A mapping of each option's snake_case name to its default value.
+    """
+    return {
+        option.as_snake_case: option.default
+        for key, option in obj.all_options.items()
+        if key == option.name and option.default is not MISSING
+    }
+
+
+def get_constrained_options(obj: SupportsOptions, /) -> List[Option[Any]]:
+    """Get the object's options that declare requirements or conflicts.
+
+    These are the only options that :meth:`Option.validate_requires` and
+    :meth:`Option.validate_conflicts` can reject, so the parser validates
+    just these. Like :func:`get_option_lookup`, the list is cached on the
+    object until its options change.
+
+    Parameters
+    ----------
+    obj : :class:`SupportsOptions`
+        The object whose options to collect.
+
+    Returns
+    -------
+    :class:`list`
+        The options with requirements or conflicts, in declaration order.
+    """
+    constrained = obj._constrained_options
+
+    if constrained is None:
+        constrained = [
+            option
+            for key, option in obj.all_options.items()
+            if key == option.name and (option.requires or option.conflicts)
+        ]
+        obj._constrained_options = constrained
+
+    return constrained
 
 
 DefaultHelp = Option[bool](
@@ -285,9 +402,10 @@ def add_option(obj: SupportsOptions, option: Option[Any]) -> None:
     if option.name in obj.all_options:
         raise ValueError(f"Option {option.name!r} already exists.")
 
+    obj._invalidate()
     obj.all_options[option.name] = option
 
-    if option.alias is MISSING:
+    if option.alias is None:
         return
 
     if option.alias in obj.all_options:
@@ -321,11 +439,11 @@ def remove_option(obj: SupportsOptions, /, name: str) -> Optional[Option[Any]]:
     if option is None:
         return None
 
-    has_alias = option.alias is not MISSING
+    obj._invalidate()
 
-    if has_alias:
+    if option.alias is not None:
         if name == option.alias:
-            option.alias = MISSING
+            option.alias = None
         else:
             _ = obj.all_options.pop(option.alias, None)
 
@@ -9,7 +9,7 @@ to the appropriate subcommand.
 """
 from __future__ import annotations
 
-import dataclasses
+import collections
 import importlib
 import logging
 import os
@@ -20,15 +20,22 @@ from .commands import Command, SupportsCommands, add_command
 from .groups import Group, accumulate_commands
 from .help import Help, HelpFormatter
 from .lexer import Lexer, TokenType
-from .options import DefaultHelp, add_option
+from .options import (
+    DefaultHelp,
+    add_option,
+    get_constrained_options,
+    get_option_defaults,
+    get_option_lookup,
+)
 from .utils import MISSING
 
 if TYPE_CHECKING:
     from builtins import dict as Dict
     from builtins import list as List
-    from builtins import set as Set
-    from typing import Any, Callable, Optional, Union
+    from builtins import tuple as Tuple
+    from typing import Any, Callable, Deque, Optional, Union
 
+    from .arguments import Argument
     from .lexer import Token
     from .options import Option
 
@@ -51,25 +58,79 @@ class Extension:
         accumulate_commands(self)
         return self
 
+    def _invalidate(self) -> None:
+        # Nothing is built from `all_commands`, so there is nothing to discard.
+        pass
+
 
-@dataclasses.dataclass
 class _Context:
     """Provides context to the various parser methods about the current
     state of the parser.
 
     Attributes
     ----------
-    command : Union[:class:`Command`, :class:`SupportsCommands`]
+    command : :class:`Command`, :class:`Group` or :class:`ArgumentParser`
         The command that is currently being invoked.
     positional : :class:`list`
         A list of positional arguments that have been parsed.
     keyword : :class:`dict`
         A mapping of keyword arguments that have been parsed.
+    subcommands : Optional[:class:`dict`]
+        The :attr:`command`'s subcommands, or ``None`` if it does not
+        implement :class:`SupportsCommands`.
+    option_lookup : :class:`dict`
+        The :attr:`command`'s options keyed by every accepted spelling; see
+        :func:`.get_option_lookup`.
+    arguments : :class:`list`
+        The :attr:`command`'s positional arguments, if it has any.
     """
 
-    command: Union[Command[Any], SupportsCommands]
-    positional: List[Any] = dataclasses.field(default_factory=list)
-    keyword: Dict[str, Any] = dataclasses.field(default_factory=dict)
+    __slots__ = (
+        "command",
+        "positional",
+        "keyword",
+        "subcommands",
+        "option_lookup",
+        "arguments",
+    )
+
+    subcommands: Optional[Dict[str, Union[Command[Any], Group]]]
+    arguments: List[Argument]
+
+    def __init__(
+        self, command: Union[Command[Any], Group, ArgumentParser]
+    ) -> None:
+        self.positional: List[Any] = []
+        self.keyword: Dict[str, Any] = {}
+        self.set_command(command)
+
+    def set_command(
+        self, command: Union[Command[Any], Group, ArgumentParser]
+    ) -> None:
+        """Make ``command`` the current command.
+
+        The attributes derived from the command are looked up here, once,
+        so the token handlers can read them directly from the context.
+
+        Parameters
+        ----------
+        command : :class:`Command`, :class:`Group` or :class:`ArgumentParser`
+            The command that is now being invoked.
+        """
+        self.command = command
+        self.subcommands = (
+            command.all_commands
+            if isinstance(command, SupportsCommands)
+            else None
+        )
+        self.option_lookup = get_option_lookup(command)
+        self.arguments = getattr(command, "arguments", [])
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(command={self.command!r}, "
+            f"positional={self.positional!r}, keyword={self.keyword!r})"
+        )
 
 
 @final
@@ -111,24 +172,47 @@ class ArgumentParser:
         self.epilog = epilog
         self.name = program
 
-        self.all_commands: Dict[str, Union[Command[Any], SupportsCommands]]
+        self.all_commands: Dict[str, Union[Command[Any], Group]]
         self.all_commands = {}
         self.all_options: Dict[str, Option[Any]] = {}
 
+        # Built from `all_commands` and `all_options` on first use, and
+        # discarded by `_invalidate` whenever either of them changes.
+        self._commands: Optional[List[Union[Command[Any], Group]]] = None
+        self._options: Optional[List[Option[Any]]] = None
+        self._option_lookup: Optional[Dict[str, Option[Any]]] = None
+        self._constrained_options: Optional[List[Option[Any]]] = None
+
         add_option(self, DefaultHelp)
         accumulate_commands(self)
 
+    def _invalidate(self) -> None:
+        self._commands = None
+        self._options = None
+        self._option_lookup = None
+        self._constrained_options = None
+
     @property
-    def commands(self) -> Set[Union[Command[Any], SupportsCommands]]:
-        """A set of all commands that are attached to this parser."""
-        # Exclude aliases while retaining the original order.
-        return [v for k, v in self.all_commands.items() if k == v.name]
+    def commands(self) -> List[Union[Command[Any], Group]]:
+        """A list of all commands that are attached to this parser."""
+        if self._commands is None:
+            # Exclude aliases while retaining the original order.
+            self._commands = [
+                v for k, v in self.all_commands.items() if k == v.name
+            ]
+
+        return self._commands
 
     @property
-    def options(self) -> Set[Option[Any]]:
-        """A set of all options that are attached to this parser."""
-        # Exclude aliases while retaining the original order.
-        return [v for k, v in self.all_options.items() if k == v.name]
+    def options(self) -> List[Option[Any]]:
+        """A list of all options that are attached to this parser."""
+        if self._options is None:
+            # Exclude aliases while retaining the original order.
+            self._options = [
+                v for k, v in self.all_options.items() if k == v.name
+            ]
+
+        return self._options
 
     def display_help(self, *, fmt: HelpFormatter) -> None:
         """Display this help message and exit."""
@@ -176,68 +260,96 @@ class ArgumentParser:
 
     def parse(
         self,
-        args: List[str] = sys.argv,
+        args: Optional[List[str]] = None,
         /,
         *,
-        help_fmt: HelpFormatter = HelpFormatter(),
+        help_fmt: Optional[HelpFormatter] = None,
     ) -> None:
         """Parse the command-line arguments.
 
         Parameters
         ----------
-        args : :class:`list`, optional
-            The command-line arguments to parse. Defaults to :data:`sys.argv`.
+        args : Optional[:class:`list`]
+            The command-line arguments to parse, including the program name.
+            Defaults to :data:`sys.argv` at the time of the call.
 
         Other Parameters
         ----------------
-        help_fmt : :class:`HelpFormatter`, optional
+        help_fmt : Optional[:class:`HelpFormatter`]
             The help formatter to use. Defaults to a :class:`.HelpFormatter`
-            with default settings.
+            with default settings, created only if help is displayed.
         """
-        lexer = Lexer(args[1:])
+        if args is None:
+            args = sys.argv
+
+        # The lexer keeps a reference to its arguments rather than copying
+        # them, so this slice is the only copy made of the command line.
+        argv = args[1:]
+        lexer = Lexer(argv)
         ctx = _Context(self)
-        deferred: List[Token] = []
+        # Most command lines have few or no options, so the queue is only
+        # created once the first option token shows up.
+        deferred: Optional[Deque[Token]] = None
+
+        # Dispatch on the raw token type rather than the `is_*` properties.
+        # The lexer guarantees the shape of each token's value, so the extra
+        # checks those properties make are redundant here, and comparing ints
+        # is cheaper than a property call per token. Everything the loop
+        # touches per token is bound to a local up front.
+        argument_type = TokenType.ARGUMENT
+        escape_type = TokenType.ESCAPE
+        option_types = (TokenType.LONG_OPTION, TokenType.SHORT_OPTION)
+        take_argument = lexer.take_argument
+        handle_argument = handle_argument_token
 
         for token in lexer:
-            if token.is_option:
-                deferred.append(token)
+            token_type = token.token_type
 
-                try:
-                    next_token = lexer.peek()
-                except StopIteration:
-                    next_token = None
+            if token_type in option_types:
+                if deferred is None:
+                    deferred = collections.deque()
+
+                deferred.append(token)
 
-                if next_token is None or next_token.is_option:
-                    continue
+                next_token = take_argument()
 
-                if next_token.is_argument:
+                if next_token is not None:
                     deferred.append(next_token)
-                    _ = next(lexer)
 
-            elif token.is_argument:
-                handle_argument_token(token, None, ctx)
-            elif token.is_escape:
+            elif token_type == argument_type:
+                handle_argument(token, None, ctx)
+            elif token_type == escape_type:
                 continue
-            elif token.is_stdin:
+            elif token_type == TokenType.STDIN:
                 raise NotImplementedError
             else:
                 raise NotImplementedError
 
-        handle_deferred_tokens(deferred, ctx)
+        if deferred is not None:
+            handle_deferred_tokens(deferred, ctx)
 
-        for option in ctx.command.all_options.values():
-            option_name = option.as_snake_case
-            if option_name in ctx.keyword or option.default is MISSING:
-                continue
+        command = ctx.command
+        defaults = get_option_defaults(command)
+
+        if defaults:
+            # Values from the command line take precedence over defaults.
+            ctx.keyword = {**defaults, **ctx.keyword}
 
-            ctx.keyword[option_name] = option.default
+        # Validate only once every default is in place, since an option may
+        # require another option that was filled in by its default.
+        # frozenset.intersection/difference iterate their argument unless it
+        # is a set, so the names are collected into one up front.
+        keyword_names = set(ctx.keyword)
 
-        for opt in ctx.keyword.keys():
-            option = ctx.command.all_options[opt]
-            option.validate_requires(ctx.keyword.keys())
-            option.validate_conflicts(ctx.keyword.keys())
+        for option in get_constrained_options(command):
+            if option.as_snake_case in keyword_names:
+                option.validate_requires(keyword_names)
+                option.validate_conflicts(keyword_names)
+
+        if ctx.keyword.pop("help", False) or not argv:
+            if help_fmt is None:
+                help_fmt = HelpFormatter()
 
-        if ctx.keyword.pop("help", False) or not lexer.args:
             ctx.command.display_help(fmt=help_fmt)
             return
 
@@ -390,102 +502,156 @@ class ArgumentParser:
         return decorator
 
 
-def invoke_command(ctx: _Context, help_fmt: HelpFormatter) -> None:
+def invoke_command(
+    ctx: _Context, help_fmt: Optional[HelpFormatter] = None
+) -> None:
     try:
         ctx.command.invoke(*ctx.positional, **ctx.keyword)
     except TypeError:  # argument-related error
+        if help_fmt is None:
+            help_fmt = HelpFormatter()
+
         ctx.command.display_help(fmt=help_fmt)
     except Exception as exc:
         _log.exception(
-            f"Failed to invoke command {ctx.command.name!r} with "
-            f"positional arguments {ctx.positional!r} and "
-            f"keyword arguments {ctx.keyword!r}: {exc}"
+            "Failed to invoke command %r with positional arguments %r and "
+            "keyword arguments %r: %s",
+            ctx.command.name,
+            ctx.positional,
+            ctx.keyword,
+            exc,
         )
 
 
-def handle_deferred_tokens(deferred: List[Token], /, ctx: _Context) -> None:
-    token_mapping = {
-        TokenType.LONG_OPTION: handle_long_option_token,
-        TokenType.SHORT_OPTION: handle_short_option_token,
-        TokenType.ARGUMENT: handle_argument_token,
-    }
-
+def handle_deferred_tokens(deferred: Deque[Token], /, ctx: _Context) -> None:
     while deferred:
-        token = deferred.pop(0)
+        token = deferred.popleft()
         next_token = deferred[0] if deferred else None
 
-        token_mapping[token.token_type](token, next_token, ctx)
+        # An option that takes its value from the next token consumes it, so
+        # the value is not handled again as a positional argument.
+        if _TOKEN_DISPATCH[token.token_type](token, next_token, ctx):
+            deferred.popleft()
 
 
 def handle_long_option_token(
     token: Token,
     next_token: Optional[Token],
     ctx: _Context,
-) -> None:
+) -> bool:
     flag, value = token.from_long_option()
 
-    if token.as_snake_case not in ctx.command.all_options.keys():
-        raise ValueError(f"invalid option: {token}")
-
-    option = ctx.command.all_options[token.as_snake_case]
+    option = ctx.option_lookup.get(flag)
 
-    if value == "":
-        valid_next_token = next_token is not None and next_token.is_argument
-
-        if option.target_type is bool:
-            assert option.default is not MISSING
-            value = str(not option.default)
-        elif valid_next_token and option.n_args.maximum > 0:
-            value = next_token.from_argument()
-        else:
-            value = ""
+    if option is None:
+        raise ValueError(f"invalid option: --{flag}")
 
-    converted_value = option.convert(value)
-    ctx.keyword[option.as_snake_case] = converted_value
+    return store_option_value(option, value, next_token, ctx)
 
 
 def handle_short_option_token(
     token: Token,
     next_token: Optional[Token],
     ctx: _Context,
-) -> None:
+) -> bool:
+    # `option_lookup` is keyed by option names, aliases and their case
+    # variants, so each flag resolves to its option with a single lookup.
+    consumed = False
+
     for flag, value in token.from_short_option():
-        try:
-            option = ctx.command.all_options[flag]
-        except KeyError:
+        option = ctx.option_lookup.get(flag)
+
+        if option is None:
             raise ValueError(f"invalid option: {flag}")
 
-        new_token_type = TokenType.LONG_OPTION
-        new_value = "--" + option.as_kebab_case
+        if store_option_value(option, value, next_token, ctx):
+            consumed = True
 
-        if value is not None:
-            new_value += "=" + value
+    return consumed
 
-        new_token = Token(new_token_type, new_value)
-        handle_long_option_token(new_token, next_token, ctx)
+
+def store_option_value(
+    option: Option[Any],
+    value: str,
+    next_token: Optional[Token],
+    ctx: _Context,
+) -> bool:
+    consumed = False
+
+    if value == "":
+        valid_next_token = (
+            next_token is not None
+            and next_token.token_type == TokenType.ARGUMENT
+        )
+
+        if option.target_type is bool:
+            # A bare flag toggles its default; the result is already a bool,
+            # so there is nothing to convert.
+            assert option.default is not MISSING
+            ctx.keyword[option.as_snake_case] = not option.default
+            return False
+        elif valid_next_token and option.n_args.maximum > 0:
+            value = next_token.from_argument()
+            consumed = True
+        else:
+            value = ""
+
+    converted_value = option.convert(value)
+    ctx.keyword[option.as_snake_case] = converted_value
+    return consumed
 
 
 def handle_argument_token(
     token: Token,
     next_token: Optional[Token],
     ctx: _Context,
-) -> None:
+) -> bool:
     value = token.from_argument()
 
-    if isinstance(ctx.command, SupportsCommands):
-        try:
-            ctx.command = ctx.command.all_commands[value]
-        except KeyError:
+    # Checking a runtime protocol walks its members on every call, so the
+    # subcommands are found once by `_Context.set_command`.
+    subcommands = ctx.subcommands
+
+    if subcommands is not None:
+        command = subcommands.get(value)
+
+        if command is None:
             raise ValueError(f"invalid command: {value}")
 
-        return
+        ctx.set_command(command)
+
+        return False
 
     index = len(ctx.positional)
+    arguments = ctx.arguments
 
-    try:
-        argument = ctx.command.arguments[index]
-    except IndexError:
+    if index >= len(arguments):
         raise ValueError(f"too many arguments: {value}")
 
+    argument = arguments[index]
     converted_value = argument.convert(value)
     ctx.positional.append(converted_value)
+    return False
+
+
+def handle_unexpected_token(
+    token: Token,
+    next_token: Optional[Token],
+    ctx: _Context,
+) -> bool:
+    raise NotImplementedError(f"unexpected deferred token: {token}")
+
+
+# Token types are small consecutive ints, so the handlers are stored in a
+# tuple indexed by token type; indexing a tuple is cheaper than hashing into
+# a dict. Token types that are never deferred map to a handler that raises.
+_TOKEN_DISPATCH: Tuple[
+    Callable[[Token, Optional[Token], _Context], bool], ...
+] = (
+    handle_unexpected_token,  # 0 is not a token type.
+    handle_long_option_token,  # TokenType.LONG_OPTION
+    handle_short_option_token,  # TokenType.SHORT_OPTION
+    handle_argument_token,  # TokenType.ARGUMENT
+    handle_unexpected_token,  # TokenType.ESCAPE
+    handle_unexpected_token,  # TokenType.STDIN
+)
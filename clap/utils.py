@@ -7,7 +7,6 @@ This module contains utility functions and classes used by the other modules.
 """
 from __future__ import annotations
 
-import re
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -47,4 +46,7 @@ def fold_text(text: str, /) -> str:
     str
         The cleaned text.
     """
-    return re.sub(r"\s+", " ", text).strip()
+    # str.split() with no separator splits on runs of the same characters
+    # that `\s` matches and drops them from both ends, so this is equivalent
+    # to collapsing whitespace with a regex and stripping, only faster.
+    return " ".join(text.split())
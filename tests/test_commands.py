@@ -0,0 +1,45 @@
+from clap.commands import parse_docstring
+
+
+def test_parse_docstring_reads_both_parameter_sections():
+    docstring = """Brief.
+
+Parameters
+----------
+a : int
+    The first.
+
+Other Parameters
+----------------
+b : str
+    The second,
+    on two lines.
+"""
+    data = parse_docstring(docstring)
+
+    assert data["__brief__"] == "Brief."
+    assert data["a"] == "The first."
+    assert data["b"] == "The second, on two lines."
+
+
+def test_parse_docstring_ignores_later_parameters_heading():
+    docstring = """Brief.
+
+Parameters
+----------
+a : int
+    The first.
+
+Notes
+-----
+A docstring can document its parameters like so:
+
+Parameters
+----------
+b : int
+    Not a parameter of this function.
+"""
+    data = parse_docstring(docstring)
+
+    assert data["a"] == "The first."
+    assert "b" not in data
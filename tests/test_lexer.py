@@ -0,0 +1,100 @@
+import pytest
+
+from clap.lexer import Lexer, Token, TokenType
+
+
+def test_tokenize_all_matches_iteration():
+    args = ["run", "--name=foo", "-ab", "-5", "--", "--not-an-option", "-"]
+
+    tokens = [(token.token_type, token.value) for token in Lexer(args)]
+
+    assert tokens == [
+        (TokenType.ARGUMENT, "run"),
+        (TokenType.LONG_OPTION, "--name=foo"),
+        (TokenType.SHORT_OPTION, "-ab"),
+        (TokenType.ARGUMENT, "-5"),
+        (TokenType.ESCAPE, "--"),
+        (TokenType.ARGUMENT, "--not-an-option"),
+        (TokenType.ARGUMENT, "-"),
+    ]
+    assert [
+        (token.token_type, token.value) for token in Lexer(args).tokenize_all()
+    ] == tokens
+
+
+def test_tokenize_all_starts_at_the_current_position():
+    lexer = Lexer(["run", "--verbose", "a"])
+    next(lexer)
+
+    assert [token.value for token in lexer.tokenize_all()] == [
+        "--verbose",
+        "a",
+    ]
+    assert lexer.tokenize_all() == []
+
+
+def test_peek_does_not_advance():
+    lexer = Lexer(["run", "a"])
+
+    assert lexer.peek().value == "run"
+    assert lexer.peek().value == "run"
+    assert next(lexer).value == "run"
+    assert lexer.peek().value == "a"
+    assert next(lexer).value == "a"
+    assert lexer.peek() is None
+
+
+def test_take_argument():
+    lexer = Lexer(["--count", "3", "--verbose", "--", "-x"])
+
+    assert next(lexer).value == "--count"
+    assert lexer.take_argument().value == "3"
+    # The next token is an option, so it is left for the caller.
+    assert lexer.take_argument() is None
+    assert next(lexer).value == "--verbose"
+    # `--` is the escape token, not an argument.
+    assert lexer.take_argument() is None
+    assert next(lexer).token_type == TokenType.ESCAPE
+
+    token = lexer.take_argument()
+    assert (token.token_type, token.value) == (TokenType.ARGUMENT, "-x")
+    assert lexer.take_argument() is None
+
+
+def test_take_argument_accepts_negative_numbers():
+    lexer = Lexer(["-5", "-"])
+
+    assert lexer.take_argument().value == "-5"
+    assert lexer.take_argument() is None
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("-abc", [("a", ""), ("b", ""), ("c", "")]),
+        ("-abc=foo,bar", [("a", ""), ("b", ""), ("c", "foo,bar")]),
+        ("-abc123", [("a", ""), ("b", ""), ("c", "123")]),
+        ("-", []),
+    ],
+)
+def test_from_short_option(value, expected):
+    options = Token(TokenType.SHORT_OPTION, value).from_short_option()
+
+    assert options == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("-5", True), ("-12", True), ("-", False), ("5", False), ("-a", False)],
+)
+def test_is_negative_number(value, expected):
+    token = Token(TokenType.ARGUMENT, value)
+
+    assert token.is_negative_number is expected
+
+
+def test_negative_numbers_are_arguments():
+    lexer = Lexer(["-5"])
+
+    assert lexer.get_token_type("-5") == TokenType.ARGUMENT
+    assert next(lexer).is_argument
@@ -0,0 +1,52 @@
+from typing import NamedTuple
+
+import pytest
+
+import clap
+from clap.metadata import Range, extract_metadata
+
+
+class Bounds(NamedTuple):
+    minimum: int
+    maximum: int
+
+
+class SubRange(Range):
+    pass
+
+
+@pytest.mark.parametrize(
+    ("n_args", "expected"),
+    [
+        (2, Range(2, 2)),
+        (True, Range(1, 1)),
+        ((1, None), Range(1, None)),
+        (Bounds(0, 3), Range(0, 3)),
+        (SubRange(1, 2), Range(1, 2)),
+    ],
+)
+def test_option_n_args(n_args, expected):
+    option = clap.Option(name="x", brief="X.", n_args=n_args)
+    assert option.n_args == expected
+
+
+def test_option_n_args_rejects_other_types():
+    with pytest.raises(TypeError):
+        clap.Option(name="x", brief="X.", n_args=[1, 2])
+
+
+@pytest.mark.parametrize(
+    ("n_args", "expected"),
+    [
+        ((1, None), Range(1, None)),
+        (Bounds(0, 3), Range(0, 3)),
+        (SubRange(1, 2), Range(1, 2)),
+    ],
+)
+def test_argument_n_args(n_args, expected):
+    argument = clap.Argument("x", "X.", n_args=n_args)
+    assert argument.n_args == expected
+
+
+def test_extract_metadata_accepts_range_subclass():
+    assert extract_metadata((SubRange(1, 2), "unknown")) == {"n_args": (1, 2)}
@@ -0,0 +1,204 @@
+import pytest
+
+import clap
+
+
+class Extension(clap.Extension):
+    @clap.command()
+    def add(self, a: int, b: int, /) -> None:
+        """Add two numbers.
+
+        Parameters
+        ----------
+        a : int
+            The first number.
+        b : int
+            The second number.
+        """
+
+
+@pytest.fixture
+def program():
+    parser = clap.ArgumentParser("Test program.", program="prog")
+    calls = []
+
+    @parser.command()
+    def run(
+        path: str = "",
+        /,
+        *,
+        max_count: int = 1,
+        dry_run: bool = False,
+        verbose: bool = False,
+    ) -> None:
+        """Run something.
+
+        Parameters
+        ----------
+        path : str
+            The path.
+        max_count : int
+            The maximum count.
+        dry_run : bool
+            Only pretend.
+        verbose : bool
+            Be loud.
+        """
+        calls.append((path, max_count, dry_run, verbose))
+
+    clap.remove_option(run, "verbose")
+    verbose = clap.Option(
+        name="verbose", brief="Be loud.", target_type=bool, alias="v"
+    )
+    clap.add_option(run, verbose)
+
+    steady = clap.Option(
+        name="steady",
+        brief="Keep the count.",
+        requires=clap.Requires("max_count"),
+    )
+    slow = clap.Option(
+        name="slow", brief="Go slow.", conflicts=clap.Conflicts("dry_run")
+    )
+    clap.add_option(run, steady)
+    clap.add_option(run, slow)
+
+    return parser, calls
+
+
+def parse(program, *args):
+    parser, calls = program
+    parser.parse(["prog", "run", *args])
+    return calls
+
+
+def test_help_after_removing_option_alias(capsys):
+    parser = clap.ArgumentParser("Test program.", program="prog")
+    option = clap.Option(
+        name="verbose", brief="Be loud.", target_type=bool, alias="v"
+    )
+    clap.add_option(parser, option)
+
+    parser.parse(["prog"])
+    assert "-v, --verbose" in capsys.readouterr().out
+
+    clap.remove_option(parser, "v")
+
+    parser.parse(["prog"])
+    out = capsys.readouterr().out
+    assert "-v, --verbose" not in out
+    assert "--verbose" in out
+
+
+def test_help_after_changing_command_brief(capsys):
+    parser = clap.ArgumentParser("Test program.", program="prog")
+    parser.add_extension(Extension())
+
+    parser.parse(["prog"])
+    assert "Add two numbers." in capsys.readouterr().out
+
+    parser.all_commands["add"].brief = "Sum two numbers."
+
+    parser.parse(["prog"])
+    out = capsys.readouterr().out
+    assert "Sum two numbers." in out
+    assert "Add two numbers." not in out
+
+
+def test_help_after_changing_option(capsys):
+    parser = clap.ArgumentParser("Test program.", program="prog")
+    option = clap.Option(name="level", brief="The level.", default=1)
+    clap.add_option(parser, option)
+
+    parser.parse(["prog"])
+    assert "The level. [default: 1]" in capsys.readouterr().out
+
+    option.brief = "The new level."
+    option.default = 2
+
+    parser.parse(["prog"])
+    assert "The new level. [default: 2]" in capsys.readouterr().out
+
+
+def test_deferred_tokens_dispatch_by_type(program):
+    # An option defers itself and the token after it; the argument that
+    # follows a flag is then dispatched as a positional argument.
+    calls = parse(program, "-v", "--max-count=3", "--dry-run", "a")
+
+    assert calls == [("a", 3, True, True)]
+
+
+def test_stdin_token_is_not_supported(program):
+    with pytest.raises(NotImplementedError):
+        parse(program, "-")
+
+
+@pytest.mark.parametrize(
+    ("args", "expected"),
+    [
+        (["--max-count=3"], ("", 3, False, False)),
+        (["--max_count=3"], ("", 3, False, False)),
+        (["--dry-run"], ("", 1, True, False)),
+        (["--dry_run"], ("", 1, True, False)),
+        (["-v"], ("", 1, False, True)),
+        (["--verbose"], ("", 1, False, True)),
+    ],
+)
+def test_option_spellings(program, args, expected):
+    assert parse(program, *args) == [expected]
+
+
+def test_invalid_option(program):
+    with pytest.raises(ValueError, match="invalid option: --max-counts$"):
+        parse(program, "--max-counts=3")
+
+
+def test_option_defaults_fill_missing_keywords(program):
+    parser, calls = program
+
+    parser.parse(["prog", "run"])
+    parser.parse(["prog", "run", "--max-count=3"])
+
+    assert calls == [("", 1, False, False), ("", 3, False, False)]
+
+
+def test_option_defaults_follow_changes(program):
+    parser, calls = program
+    parser.all_commands["run"].all_options["max_count"].default = 5
+
+    parser.parse(["prog", "run"])
+
+    assert calls == [("", 5, False, False)]
+
+
+def test_requires_is_satisfied_by_a_default(program):
+    # Raises if the default for --max-count is not taken into account.
+    parse(program, "--steady=yes")
+
+
+def test_conflicts_include_defaults(program):
+    with pytest.raises(ValueError, match="conflicts"):
+        parse(program, "--slow=yes")
+
+
+@pytest.mark.parametrize(
+    ("args", "expected"),
+    [
+        (["--max-count", "3", "a"], ("a", 3, False, False)),
+        (["a", "--max-count", "3"], ("a", 3, False, False)),
+        (["a", "--dry-run"], ("a", 1, True, False)),
+        (["--dry-run", "a"], ("a", 1, True, False)),
+        (["--dry-run", "--", "--max-count"], ("--max-count", 1, True, False)),
+    ],
+)
+def test_option_values(program, args, expected):
+    assert parse(program, *args) == [expected]
+
+
+@pytest.mark.parametrize(
+    "args", [["a", "--max-count"], ["--max-count", "--", "3"]]
+)
+def test_option_missing_value(program, args):
+    # Neither the end of argv nor `--` is taken as the option's value.
+    with pytest.raises(ValueError):
+        parse(program, *args)